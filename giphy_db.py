@@ -1,122 +1,363 @@
 from __future__ import annotations
 
+import atexit
+import functools
+import itertools
 import json
 import os
+import queue
+import re
 import sqlite3
 import logging
-from datetime import datetime
+import threading
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 
 
+logger = logging.getLogger(__name__)
+
 DEFAULT_DB = Path(__file__).parent / os.environ.get("GIPHYWALL_DB_FILE", "giphywall.db")
-LOGIN_IDENTIFIER_COLUMN: Optional[str] = None
+_DEFAULT_DB_STR = str(DEFAULT_DB)
+
+_WORD_RE = re.compile(r"\W+")
+_FILLERS = frozenset(("such", "much", "very"))
+
+# ISO-8601 UTC timestamp computed inside SQLite, so write paths skip a Python
+# datetime allocation and one bound parameter per row.
+_SQL_NOW = "strftime('%Y-%m-%dT%H:%M:%fZ', 'now')"
+
+# Pragmas applied once per connection: WAL keeps readers and the writer from
+# blocking each other, and the relaxed sync/cache settings avoid paying a full
+# fsync and cold page cache on every call.
+_CONNECTION_PRAGMAS = """
+PRAGMA journal_mode=WAL;
+PRAGMA synchronous=NORMAL;
+PRAGMA temp_store=MEMORY;
+PRAGMA cache_size=-64000;
+PRAGMA busy_timeout=5000;
+"""
+
+
+@functools.lru_cache(maxsize=16)
+def _prepare_dir(path_str: str) -> str:
+    """Create the parent directory once per unique path.
+
+    Cached so the stat+mkdir syscall pair runs a single time instead of
+    on every database access.
+    """
+    Path(path_str).parent.mkdir(parents=True, exist_ok=True)
+    return path_str
 
 
-def _ensure_db_path(db_path: Optional[Path | str]) -> Path:
-    if db_path:
-        path = Path(db_path)
-    else:
-        path = DEFAULT_DB
-    path.parent.mkdir(parents=True, exist_ok=True)
-    return path
+def _ensure_db_path(db_path: Optional[Path | str]) -> str:
+    return _prepare_dir(str(db_path) if db_path else _DEFAULT_DB_STR)
 
 
-def get_connection(db_path: Optional[Path | str] = None) -> sqlite3.Connection:
-    path = _ensure_db_path(db_path)
+def _configure_connection(conn: sqlite3.Connection) -> sqlite3.Connection:
+    conn.row_factory = sqlite3.Row
     try:
-        conn = sqlite3.connect(str(path))
+        conn.executescript(_CONNECTION_PRAGMAS)
     except Exception:
-        # fallback to in-memory DB to avoid raising for missing filesystem
-        conn = sqlite3.connect(":memory:")
-    conn.row_factory = sqlite3.Row
+        # in-memory or read-only fallbacks may reject some pragmas; keep going
+        pass
     return conn
 
 
-def _get_login_identifier_column(conn: sqlite3.Connection) -> str:
-    """Return whichever column the users table uses for login ids."""
-    global LOGIN_IDENTIFIER_COLUMN
-    if LOGIN_IDENTIFIER_COLUMN:
-        return LOGIN_IDENTIFIER_COLUMN
+class _PooledConnection:
+    """Context manager that borrows a connection and returns it to its pool."""
+
+    __slots__ = ("_pool", "_conn")
+
+    def __init__(self, pool: "_ConnectionPool") -> None:
+        self._pool = pool
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def __enter__(self) -> sqlite3.Connection:
+        self._conn = self._pool._checkout()
+        return self._conn
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        conn, self._conn = self._conn, None
+        if conn is not None:
+            # never check in a connection mid-transaction: an abandoned
+            # write transaction would keep holding the WAL writer lock and
+            # pin later reads on this connection to a stale snapshot
+            if conn.in_transaction:
+                try:
+                    conn.rollback()
+                except Exception:
+                    pass
+            self._pool._checkin(conn)
+        return False
+
+
+class _ConnectionPool:
+    """Bounded LIFO pool of pre-warmed connections for one database file.
+
+    WAL mode lets several pooled readers run alongside a writer; SQLite
+    itself serializes concurrent writes, so no separate writer handle is
+    needed. LIFO reuse keeps the hottest page cache on top.
+    """
+
+    def __init__(self, path: str, maxsize: int = 8) -> None:
+        self._path = path
+        self._idle: "queue.LifoQueue[sqlite3.Connection]" = queue.LifoQueue(maxsize=maxsize)
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            conn = sqlite3.connect(self._path, check_same_thread=False, cached_statements=256)
+        except Exception:
+            # fallback to in-memory DB to avoid raising for missing filesystem
+            conn = sqlite3.connect(":memory:", cached_statements=256)
+        return _configure_connection(conn)
+
+    def acquire(self) -> _PooledConnection:
+        return _PooledConnection(self)
+
+    def _checkout(self) -> sqlite3.Connection:
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect()
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        try:
+            self._idle.put_nowait(conn)
+        except queue.Full:
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+    def close_all(self) -> None:
+        while True:
+            try:
+                conn = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+_pools: Dict[str, _ConnectionPool] = {}
+_pools_lock = threading.Lock()
+
+
+def _pool_for(path: str) -> _ConnectionPool:
+    with _pools_lock:
+        pool = _pools.get(path)
+        if pool is None:
+            pool = _pools[path] = _ConnectionPool(path)
+        return pool
+
+
+def _close_pools() -> None:
+    with _pools_lock:
+        for pool in _pools.values():
+            pool.close_all()
+        _pools.clear()
+
+
+atexit.register(_close_pools)
+
+
+def get_connection(db_path: Optional[Path | str] = None) -> _PooledConnection:
+    """Return a context manager yielding a pooled connection for `db_path`.
+
+    Use as `with get_connection(path) as conn:`. Connections are opened
+    once, pre-warmed with the module pragmas, and recycled through a small
+    pool so repeat calls skip the file open and keep SQLite's page cache
+    warm. Callers must not close the yielded connection.
+    """
+    return _pool_for(_ensure_db_path(db_path)).acquire()
+
+
+@functools.lru_cache(maxsize=8)
+def _login_col(db_path_str: str) -> str:
+    """Return whichever column the users table uses for login ids.
+
+    Memoized per database path so the PRAGMA runs once per process
+    instead of on every call that needs the column name.
+    """
     try:
-        cur = conn.cursor()
-        cur.execute("PRAGMA table_info(users)")
-        names = {row[1] for row in cur.fetchall()}
+        with get_connection(db_path_str) as conn:
+            cur = conn.execute("PRAGMA table_info(users)")
+            names = {row[1] for row in cur.fetchall()}
         for candidate in ("login_identifier", "external_id", "kakao_id"):
             if candidate in names:
-                LOGIN_IDENTIFIER_COLUMN = candidate
-                return LOGIN_IDENTIFIER_COLUMN
+                return candidate
     except Exception:
         pass
-    LOGIN_IDENTIFIER_COLUMN = "login_identifier"
-    return LOGIN_IDENTIFIER_COLUMN
+    return "login_identifier"
+
+
+@functools.lru_cache(maxsize=8)
+def _user_sql(identifier_col: str) -> Tuple[str, str]:
+    """Build the identifier-column-dependent user statements once per column.
+
+    Returning the same string objects on every call keeps the SQL text
+    byte-identical so sqlite3's prepared-statement cache always hits.
+    """
+    insert = (
+        f"INSERT INTO users ({identifier_col}, username, display_name, profile_url, email, created_at, last_login)"
+        f" VALUES (?, ?, ?, ?, ?, {_SQL_NOW}, {_SQL_NOW})"
+    )
+    select = f"SELECT * FROM users WHERE {identifier_col} = ?"
+    return insert, select
+
+
+# Every query lives here as a module constant so the exact same string
+# object reaches sqlite3 on each call and its prepared-statement cache
+# always hits instead of re-parsing.
+
+_Q_GET_USER_BY_USERNAME = "SELECT * FROM users WHERE username = ?"
+_Q_GET_USER_BY_EMAIL = "SELECT * FROM users WHERE email = ?"
+_Q_GET_USER_BY_ID = "SELECT * FROM users WHERE id = ?"
+
+_Q_FIND_USER = """
+    SELECT * FROM users WHERE username = ? COLLATE NOCASE
+    UNION ALL
+    SELECT * FROM users WHERE email = ? COLLATE NOCASE
+    UNION ALL
+    SELECT * FROM users WHERE display_name = ? COLLATE NOCASE
+    LIMIT 1
+    """
+
+_Q_UPSERT_GIPHY = f"""
+    INSERT INTO giphies (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, tags, uploaded_by, created_at)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, {_SQL_NOW})
+    ON CONFLICT(uuid) DO UPDATE SET
+        giphy_id = excluded.giphy_id,
+        giphy_url = excluded.giphy_url,
+        thumbnail_url = excluded.thumbnail_url,
+        image_path = excluded.image_path,
+        title = excluded.title,
+        tags = excluded.tags,
+        uploaded_by = excluded.uploaded_by
+    """
+_Q_LIST_GIPHIES = "SELECT * FROM giphies ORDER BY id DESC"
+_Q_LIST_GIPHIES_FOR_USER = "SELECT * FROM giphies WHERE uploaded_by = ? ORDER BY id DESC"
+# narrow projection for the wall render path: only the columns the card
+# markup needs, so SQLite skips decoding tags/title/image_path per row
+_Q_WALL_CARDS = "SELECT uuid, giphy_id, thumbnail_url, giphy_url FROM giphies WHERE uploaded_by = ? ORDER BY id DESC"
+_Q_DELETE_GIPHY = "DELETE FROM giphies WHERE uuid = ?"
+
+_Q_ADD_COMMENT = f"INSERT INTO comments (giphy_uuid, comment_text, ai_generated, created_at) VALUES (?, ?, ?, {_SQL_NOW})"
+_Q_COMMENTS_FOR_GIPHY = "SELECT * FROM comments WHERE giphy_uuid = ? ORDER BY id ASC"
+
+_Q_ACCEPT_REVERSE_REQUEST = f"""
+    UPDATE friend_requests SET status = 'accepted', responded_at = {_SQL_NOW}
+    WHERE requester_id = ? AND receiver_id = ? AND status = 'pending'
+    RETURNING id
+    """
+_Q_FRIEND_PAIR_STATUS = """
+    SELECT status FROM friend_requests
+    WHERE (requester_id = ? AND receiver_id = ?)
+       OR (requester_id = ? AND receiver_id = ?)
+    ORDER BY id DESC
+    """
+_Q_INSERT_FRIEND_REQUEST = f"""
+    INSERT INTO friend_requests (requester_id, receiver_id, status, created_at)
+    SELECT ?, ?, 'pending', {_SQL_NOW}
+    WHERE EXISTS(SELECT 1 FROM users WHERE id = ?)
+    """
+_Q_GET_FRIEND_REQUEST = "SELECT * FROM friend_requests WHERE id = ?"
+_Q_UPDATE_FRIEND_REQUEST = f"UPDATE friend_requests SET status = ?, responded_at = {_SQL_NOW} WHERE id = ?"
+
+_Q_PENDING_REQUESTS = """
+    SELECT fr.*, u.username AS requester_username, u.email AS requester_email
+    FROM friend_requests fr
+    JOIN users u ON u.id = fr.requester_id
+    WHERE fr.receiver_id = ? AND fr.status = 'pending'
+    ORDER BY fr.created_at ASC, fr.id ASC
+    """
+_Q_SENT_REQUESTS = """
+    SELECT fr.*, u.username AS receiver_username, u.email AS receiver_email
+    FROM friend_requests fr
+    JOIN users u ON u.id = fr.receiver_id
+    WHERE fr.requester_id = ? AND fr.status = 'pending'
+    ORDER BY fr.created_at DESC, fr.id DESC
+    """
+
+# Accepted requests in either direction; CASE picks the "other" user so the
+# friend_requests indexes are walked directly instead of materializing a
+# UNION into a temp b-tree.
+_Q_LIST_FRIENDS = """
+    SELECT u.* FROM friend_requests fr
+    JOIN users u ON u.id = CASE WHEN fr.requester_id = ? THEN fr.receiver_id ELSE fr.requester_id END
+    WHERE (fr.requester_id = ? OR fr.receiver_id = ?) AND fr.status = 'accepted'
+    ORDER BY COALESCE(u.username, u.email)
+    """
 
 
 def init_db(db_path: Optional[Path | str] = None) -> None:
     """Create tables if they don't exist."""
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.executescript(
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            cur.executescript(
+                f"""
+            CREATE TABLE IF NOT EXISTS users (
+                id INTEGER PRIMARY KEY,
+                login_identifier TEXT UNIQUE,
+                username TEXT,
+                display_name TEXT,
+                profile_url TEXT,
+                email TEXT,
+                created_at TEXT DEFAULT ({_SQL_NOW}),
+                last_login TEXT DEFAULT ({_SQL_NOW})
+            );
+
+            CREATE TABLE IF NOT EXISTS giphies (
+                id INTEGER PRIMARY KEY,
+                uuid TEXT UNIQUE,
+                giphy_id TEXT,
+                giphy_url TEXT,
+                thumbnail_url TEXT,
+                image_path TEXT,
+                title TEXT,
+                tags TEXT,
+                uploaded_by INTEGER,
+                created_at TEXT DEFAULT ({_SQL_NOW}),
+                FOREIGN KEY(uploaded_by) REFERENCES users(id)
+            );
+
+            CREATE TABLE IF NOT EXISTS comments (
+                id INTEGER PRIMARY KEY,
+                giphy_uuid TEXT,
+                comment_text TEXT,
+                ai_generated INTEGER DEFAULT 1,
+                created_at TEXT DEFAULT ({_SQL_NOW})
+            );
+
+            CREATE TABLE IF NOT EXISTS friend_requests (
+                id INTEGER PRIMARY KEY,
+                requester_id INTEGER NOT NULL,
+                receiver_id INTEGER NOT NULL,
+                status TEXT NOT NULL DEFAULT 'pending',
+                created_at TEXT DEFAULT ({_SQL_NOW}),
+                responded_at TEXT,
+                FOREIGN KEY(requester_id) REFERENCES users(id),
+                FOREIGN KEY(receiver_id) REFERENCES users(id)
+            );
+
+            CREATE INDEX IF NOT EXISTS idx_users_username ON users(username);
+            CREATE INDEX IF NOT EXISTS idx_users_email ON users(email);
+            CREATE INDEX IF NOT EXISTS idx_users_username_nocase ON users(username COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_users_email_nocase ON users(email COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_users_display_name_nocase ON users(display_name COLLATE NOCASE);
+            CREATE INDEX IF NOT EXISTS idx_giphies_uploaded_by ON giphies(uploaded_by);
+            CREATE INDEX IF NOT EXISTS idx_comments_giphy_uuid ON comments(giphy_uuid);
+            CREATE INDEX IF NOT EXISTS idx_fr_receiver_status ON friend_requests(receiver_id, status);
+            CREATE INDEX IF NOT EXISTS idx_fr_requester_status ON friend_requests(requester_id, status);
             """
-        CREATE TABLE IF NOT EXISTS users (
-            id INTEGER PRIMARY KEY,
-            login_identifier TEXT UNIQUE,
-            username TEXT,
-            display_name TEXT,
-            profile_url TEXT,
-            email TEXT,
-            created_at TEXT,
-            last_login TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS giphies (
-            id INTEGER PRIMARY KEY,
-            uuid TEXT UNIQUE,
-            giphy_id TEXT,
-            giphy_url TEXT,
-            thumbnail_url TEXT,
-            image_path TEXT,
-            title TEXT,
-            tags TEXT,
-            uploaded_by INTEGER,
-            created_at TEXT,
-            FOREIGN KEY(uploaded_by) REFERENCES users(id)
-        );
-
-        CREATE TABLE IF NOT EXISTS comments (
-            id INTEGER PRIMARY KEY,
-            giphy_uuid TEXT,
-            comment_text TEXT,
-            ai_generated INTEGER DEFAULT 1,
-            created_at TEXT
-        );
-
-        CREATE TABLE IF NOT EXISTS friend_requests (
-            id INTEGER PRIMARY KEY,
-            requester_id INTEGER NOT NULL,
-            receiver_id INTEGER NOT NULL,
-            status TEXT NOT NULL DEFAULT 'pending',
-            created_at TEXT,
-            responded_at TEXT,
-            FOREIGN KEY(requester_id) REFERENCES users(id),
-            FOREIGN KEY(receiver_id) REFERENCES users(id)
-        );
-        """
-        )
-        conn.commit()
+            )
+            conn.commit()
     except Exception:
-        logging.exception("init_db failed; continuing with best-effort")
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
-
-
-def _now_iso() -> str:
-    return datetime.utcnow().isoformat() + "Z"
+        logger.error("init_db failed; continuing with best-effort", exc_info=True)
 
 
 def create_user(
@@ -128,53 +369,37 @@ def create_user(
     db_path: Optional[Path | str] = None,
 ) -> int:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        created = _now_iso()
-        identifier = login_identifier or username or email or f"local:{uuid4().hex}"
-        try:
-            identifier_col = _get_login_identifier_column(conn)
-            cur.execute(
-                f"""
-            INSERT INTO users ({identifier_col}, username, display_name, profile_url, email, created_at, last_login)
-            VALUES (?, ?, ?, ?, ?, ?, ?)""",
-                (identifier, username, display_name, profile_url, email, created, created),
-            )
-            conn.commit()
-            user_id = cur.lastrowid
-        except sqlite3.IntegrityError:
-            # user already exists; return existing id
-            identifier_col = _get_login_identifier_column(conn)
-            cur.execute(f"SELECT id FROM users WHERE {identifier_col} = ?", (identifier,))
-            row = cur.fetchone()
-            user_id = int(row["id"]) if row and "id" in row.keys() else 0
+        insert_sql, select_sql = _user_sql(_login_col(_ensure_db_path(db_path)))
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            identifier = login_identifier or username or email or f"local:{uuid4().hex}"
+            try:
+                cur.execute(
+                    insert_sql,
+                    (identifier, username, display_name, profile_url, email),
+                )
+                conn.commit()
+                user_id = cur.lastrowid
+            except sqlite3.IntegrityError:
+                # user already exists; return existing id
+                cur.execute(select_sql, (identifier,))
+                row = cur.fetchone()
+                user_id = int(row["id"]) if row and "id" in row.keys() else 0
     except Exception:
-        logging.exception("create_user failed")
+        logger.error("create_user failed", exc_info=True)
         user_id = 0
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
     return user_id
 
 
 def get_user_by_login_identifier(login_identifier: str, db_path: Optional[Path | str] = None) -> Optional[Dict[str, Any]]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        column = _get_login_identifier_column(conn)
-        cur.execute(f"SELECT * FROM users WHERE {column} = ?", (login_identifier,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        _, select_sql = _user_sql(_login_col(_ensure_db_path(db_path)))
+        with get_connection(db_path) as conn:
+            row = conn.execute(select_sql, (login_identifier,)).fetchone()
     except Exception:
-        logging.exception("get_user_by_login_identifier failed")
+        logger.error("get_user_by_login_identifier failed", exc_info=True)
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    return dict(row) if row else None
 
 
 def get_user_by_external_id(external_id: str, db_path: Optional[Path | str] = None) -> Optional[Dict[str, Any]]:
@@ -186,38 +411,24 @@ def get_user_by_username(username: str, db_path: Optional[Path | str] = None) ->
     try:
         if not username:
             return None
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM users WHERE username = ?", (username,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        with get_connection(db_path) as conn:
+            row = conn.execute(_Q_GET_USER_BY_USERNAME, (username,)).fetchone()
     except Exception:
-        logging.exception("get_user_by_username failed")
+        logger.error("get_user_by_username failed", exc_info=True)
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    return dict(row) if row else None
 
 
 def get_user_by_email(email: str, db_path: Optional[Path | str] = None) -> Optional[Dict[str, Any]]:
     try:
         if not email:
             return None
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM users WHERE email = ?", (email,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        with get_connection(db_path) as conn:
+            row = conn.execute(_Q_GET_USER_BY_EMAIL, (email,)).fetchone()
     except Exception:
-        logging.exception("get_user_by_email failed")
+        logger.error("get_user_by_email failed", exc_info=True)
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    return dict(row) if row else None
 
 
 def find_user_by_identifier(identifier: str, db_path: Optional[Path | str] = None) -> Optional[Dict[str, Any]]:
@@ -226,45 +437,21 @@ def find_user_by_identifier(identifier: str, db_path: Optional[Path | str] = Non
     if not query:
         return None
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT * FROM users
-            WHERE lower(coalesce(username, '')) = lower(?)
-               OR lower(coalesce(email, '')) = lower(?)
-               OR lower(coalesce(display_name, '')) = lower(?)
-            ORDER BY id ASC
-            LIMIT 1
-            """,
-            (query, query, query),
-        )
-        row = cur.fetchone()
-        return dict(row) if row else None
+        with get_connection(db_path) as conn:
+            row = conn.execute(_Q_FIND_USER, (query, query, query)).fetchone()
     except Exception:
-        logging.exception("find_user_by_identifier failed")
+        logger.error("find_user_by_identifier failed", exc_info=True)
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    return dict(row) if row else None
 
 def get_user_by_id(user_id: int, db_path: Optional[Path | str] = None) -> Optional[Dict[str, Any]]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM users WHERE id = ?", (user_id,))
-        row = cur.fetchone()
-        return dict(row) if row else None
+        with get_connection(db_path) as conn:
+            row = conn.execute(_Q_GET_USER_BY_ID, (user_id,)).fetchone()
     except Exception:
-        logging.exception("get_user_by_id failed")
+        logger.error("get_user_by_id failed", exc_info=True)
         return None
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+    return dict(row) if row else None
 
 
 def add_giphy(
@@ -279,136 +466,188 @@ def add_giphy(
     db_path: Optional[Path | str] = None,
 ) -> int:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        created = _now_iso()
-        tags_json = json.dumps(tags or [])
-        cur.execute(
-            """
-        INSERT OR REPLACE INTO giphies (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, tags, uploaded_by, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
-            (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, tags_json, uploaded_by, created),
-        )
-        conn.commit()
-        last = cur.lastrowid
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            tags_json = json.dumps(tags or [])
+            cur.execute(
+                _Q_UPSERT_GIPHY,
+                (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, tags_json, uploaded_by),
+            )
+            conn.commit()
+            last = cur.lastrowid
     except Exception:
-        logging.exception("add_giphy failed")
+        logger.error("add_giphy failed", exc_info=True)
         last = 0
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
     return last
 
 
-def list_giphies(db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def add_giphies(
+    records: List[Tuple[str, str, str, str, Optional[str], Optional[str], Optional[List[str]], Optional[int]]],
+    db_path: Optional[Path | str] = None,
+) -> int:
+    """Insert many giphies in one transaction; returns the number written.
+
+    Each record is (uuid, giphy_id, giphy_url, thumbnail_url, image_path,
+    title, tags, uploaded_by). Batching the whole import into a single
+    BEGIN...COMMIT pays one fsync total instead of one per row.
+    """
+    if not records:
+        return 0
+    try:
+        rows = [
+            (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, json.dumps(tags or []), uploaded_by)
+            for uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, tags, uploaded_by in records
+        ]
+        with get_connection(db_path) as conn:
+            conn.execute("BEGIN")
+            conn.executemany(_Q_UPSERT_GIPHY, rows)
+            conn.commit()
+        return len(rows)
+    except Exception:
+        logger.error("add_giphies failed", exc_info=True)
+        return 0
+
+
+def add_giphy_and_list(
+    uuid: str,
+    giphy_id: str,
+    giphy_url: str,
+    thumbnail_url: str,
+    image_path: Optional[str] = None,
+    title: Optional[str] = None,
+    tags: Optional[List[str]] = None,
+    uploaded_by: Optional[int] = None,
+    owner_id: Optional[int] = None,
+    db_path: Optional[Path | str] = None,
+) -> List[sqlite3.Row]:
+    """Insert a giphy and return `owner_id`'s wall in one transaction.
+
+    The write and the follow-up wall SELECT share a single
+    BEGIN...COMMIT, so an upload costs one fsync and one pool checkout
+    instead of a write round trip plus a separate full reload.
+    """
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM giphies ORDER BY id DESC")
-        rows = cur.fetchall()
-        results: List[Dict[str, Any]] = []
-        for r in rows:
-            row = dict(r)
+        with get_connection(db_path) as conn:
+            conn.execute("BEGIN")
+            conn.execute(
+                _Q_UPSERT_GIPHY,
+                (uuid, giphy_id, giphy_url, thumbnail_url, image_path, title, json.dumps(tags or []), uploaded_by),
+            )
+            rows = conn.execute(_Q_WALL_CARDS, (owner_id,)).fetchall() if owner_id is not None else []
+            conn.commit()
+        return rows
+    except Exception:
+        logger.error("add_giphy_and_list failed", exc_info=True)
+        return []
+
+
+def delete_giphy_and_list(
+    uuid: str,
+    owner_id: Optional[int] = None,
+    db_path: Optional[Path | str] = None,
+) -> List[sqlite3.Row]:
+    """Delete a giphy by uuid and return `owner_id`'s wall in one transaction."""
+    try:
+        with get_connection(db_path) as conn:
+            conn.execute("BEGIN")
+            conn.execute(_Q_DELETE_GIPHY, (uuid,))
+            rows = conn.execute(_Q_WALL_CARDS, (owner_id,)).fetchall() if owner_id is not None else []
+            conn.commit()
+        return rows
+    except Exception:
+        logger.error("delete_giphy_and_list failed", exc_info=True)
+        return []
+
+
+def rows_to_dicts(rows: List[sqlite3.Row]) -> List[Dict[str, Any]]:
+    """Materialize rows as plain dicts, decoding any tags JSON column.
+
+    The list_* helpers hand back sqlite3.Row objects so the hot render
+    path pays no per-row dict build; call this at the serialization
+    boundary when real dicts are required.
+    """
+    results: List[Dict[str, Any]] = []
+    for r in rows:
+        row = dict(r)
+        if "tags" in row and not isinstance(row["tags"], list):
             try:
-                row["tags"] = json.loads(row.get("tags") or "[]")
+                row["tags"] = json.loads(row["tags"] or "[]")
             except Exception:
                 row["tags"] = []
-            results.append(row)
-        return results
+        results.append(row)
+    return results
+
+
+def rows_to_json(rows: List[sqlite3.Row]) -> str:
+    return json.dumps(rows_to_dicts(rows))
+
+
+def list_giphies(db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
+    try:
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_LIST_GIPHIES).fetchall()
     except Exception:
-        logging.exception("list_giphies failed")
+        logger.error("list_giphies failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
-def list_giphies_for_user(user_id: Optional[int], db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def list_giphies_for_user(user_id: Optional[int], db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
     """Return giphies uploaded by a specific user."""
     if user_id is None:
         return []
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            "SELECT * FROM giphies WHERE uploaded_by = ? ORDER BY id DESC",
-            (user_id,),
-        )
-        rows = cur.fetchall()
-        results: List[Dict[str, Any]] = []
-        for r in rows:
-            row = dict(r)
-            try:
-                row["tags"] = json.loads(row.get("tags") or "[]")
-            except Exception:
-                row["tags"] = []
-            results.append(row)
-        return results
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_LIST_GIPHIES_FOR_USER, (user_id,)).fetchall()
     except Exception:
-        logging.exception("list_giphies_for_user failed")
+        logger.error("list_giphies_for_user failed", exc_info=True)
+        return []
+
+
+def list_wall_cards(user_id: Optional[int], db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
+    """Return just the wall-card columns for a user's giphies.
+
+    Same rows as `list_giphies_for_user` but projected down to the four
+    columns the wall actually renders.
+    """
+    if user_id is None:
+        return []
+    try:
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_WALL_CARDS, (user_id,)).fetchall()
+    except Exception:
+        logger.error("list_wall_cards failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
 def delete_giphy_by_uuid(uuid: str, db_path: Optional[Path | str] = None) -> None:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("DELETE FROM giphies WHERE uuid = ?", (uuid,))
-        conn.commit()
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            cur.execute(_Q_DELETE_GIPHY, (uuid,))
+            conn.commit()
     except Exception:
-        logging.exception("delete_giphy_by_uuid failed")
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
+        logger.error("delete_giphy_by_uuid failed", exc_info=True)
 
 
 def add_comment(giphy_uuid: str, comment_text: str, ai_generated: bool = True, db_path: Optional[Path | str] = None) -> int:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        created = _now_iso()
-        cur.execute(
-            "INSERT INTO comments (giphy_uuid, comment_text, ai_generated, created_at) VALUES (?, ?, ?, ?)",
-            (giphy_uuid, comment_text, 1 if ai_generated else 0, created),
-        )
-        conn.commit()
-        last = cur.lastrowid
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            cur.execute(_Q_ADD_COMMENT, (giphy_uuid, comment_text, 1 if ai_generated else 0))
+            conn.commit()
+            last = cur.lastrowid
     except Exception:
-        logging.exception("add_comment failed")
+        logger.error("add_comment failed", exc_info=True)
         last = 0
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
     return last
 
 
-def get_comments_for_giphy(giphy_uuid: str, db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def get_comments_for_giphy(giphy_uuid: str, db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM comments WHERE giphy_uuid = ? ORDER BY id ASC", (giphy_uuid,))
-        rows = cur.fetchall()
-        return [dict(r) for r in rows]
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_COMMENTS_FOR_GIPHY, (giphy_uuid,)).fetchall()
     except Exception:
-        logging.exception("get_comments_for_giphy failed")
+        logger.error("get_comments_for_giphy failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
 def generate_doge_comment(content: str) -> str:
@@ -417,15 +656,18 @@ def generate_doge_comment(content: str) -> str:
     This is a simple fallback generator. If you integrate an external AI
     (OpenAI, etc.) you can replace this function to call that service.
     """
-    words = [w for w in re_split_words(content) if len(w) > 2]
-    picks = (words + ["wow", "such", "much", "very"])[:6]
-    parts = [f"{p} {words[0] if words else 'wow'}" if p in ("such", "much", "very") else p for p in picks]
+    words_iter = (t.lower() for t in _WORD_RE.split(content) if len(t) > 2)
+    first = next(words_iter, None)
+    head = (first,) if first is not None else ()
+    anchor = first or "wow"
+    picks = itertools.islice(itertools.chain(head, words_iter, ("wow", "such", "much", "very")), 6)
+    parts = [f"{p} {anchor}" if p in _FILLERS else p for p in picks]
     # simple join, keep it short
     return " ".join(parts)
 
 
 def re_split_words(text: str) -> List[str]:
-    return [t.lower() for t in __import__("re").split(r"\W+", text) if t]
+    return [t.lower() for t in _WORD_RE.split(text) if t]
 
 
 def create_friend_request(requester_id: int, receiver_id: int, db_path: Optional[Path | str] = None) -> Tuple[bool, str]:
@@ -435,163 +677,107 @@ def create_friend_request(requester_id: int, receiver_id: int, db_path: Optional
     if requester_id == receiver_id:
         return False, "Cannot request own fren-ness, wow."
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        created = _now_iso()
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
 
-        cur.execute("SELECT * FROM users WHERE id = ?", (receiver_id,))
-        if not cur.fetchone():
-            return False, "No fren found there, much sad."
+            # the common mutual case first: accept a reverse pending request
+            # in one atomic statement, with no read-then-write race window
+            cur.execute(_Q_ACCEPT_REVERSE_REQUEST, (receiver_id, requester_id))
+            if cur.fetchone():
+                conn.commit()
+                return True, "Auto accept! Fren energy mutual."
 
-        cur.execute(
-            """
-            SELECT * FROM friend_requests
-            WHERE (requester_id = ? AND receiver_id = ?)
-               OR (requester_id = ? AND receiver_id = ?)
-            ORDER BY id DESC
-            """,
-            (requester_id, receiver_id, receiver_id, requester_id),
-        )
-        existing = cur.fetchone()
-        if existing:
-            status = existing["status"]
-            if status == "accepted":
-                return False, "Already frens. Much wow."
-            if status == "pending":
-                if existing["requester_id"] == requester_id:
+            cur.execute(
+                _Q_FRIEND_PAIR_STATUS,
+                (requester_id, receiver_id, receiver_id, requester_id),
+            )
+            existing = cur.fetchone()
+            if existing:
+                status = existing["status"]
+                if status == "accepted":
+                    # the zero-row UPDATE above still opened a write
+                    # transaction; end it here rather than leaking it
+                    conn.rollback()
+                    return False, "Already frens. Much wow."
+                if status == "pending":
+                    # any reverse pending was consumed above, so this is ours
+                    conn.rollback()
                     return False, "Friend req already zoomed."
-                else:
-                    cur.execute(
-                        "UPDATE friend_requests SET status = ?, responded_at = ? WHERE id = ?",
-                        ("accepted", _now_iso(), existing["id"]),
-                    )
-                    conn.commit()
-                    return True, "Auto accept! Fren energy mutual."
-
-        cur.execute(
-            """
-            INSERT INTO friend_requests (requester_id, receiver_id, status, created_at)
-            VALUES (?, ?, 'pending', ?)
-            """,
-            (requester_id, receiver_id, created),
-        )
-        conn.commit()
-        return True, "Friend req launched. Very wow."
+
+            # receiver existence folds into the INSERT itself: zero rows
+            # written means there was no such user.
+            cur.execute(_Q_INSERT_FRIEND_REQUEST, (requester_id, receiver_id, receiver_id))
+            conn.commit()
+            if cur.rowcount == 0:
+                return False, "No fren found there, much sad."
+            return True, "Friend req launched. Very wow."
     except Exception:
-        logging.exception("create_friend_request failed")
+        logger.error("create_friend_request failed", exc_info=True)
         return False, "Friend req broken rn. Much sorry."
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
-def list_pending_friend_requests(user_id: int, db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def list_pending_friend_requests(user_id: int, db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT fr.*, u.username AS requester_username, u.email AS requester_email
-            FROM friend_requests fr
-            JOIN users u ON u.id = fr.requester_id
-            WHERE fr.receiver_id = ? AND fr.status = 'pending'
-            ORDER BY fr.created_at ASC, fr.id ASC
-            """,
-            (user_id,),
-        )
-        rows = cur.fetchall()
-        return [dict(r) for r in rows]
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_PENDING_REQUESTS, (user_id,)).fetchall()
     except Exception:
-        logging.exception("list_pending_friend_requests failed")
+        logger.error("list_pending_friend_requests failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
 def respond_to_friend_request(request_id: int, receiver_id: int, accept: bool, db_path: Optional[Path | str] = None) -> Tuple[bool, str]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute("SELECT * FROM friend_requests WHERE id = ?", (request_id,))
-        req = cur.fetchone()
-        if not req or req["receiver_id"] != receiver_id:
-            return False, "No such fren ping."
-        if req["status"] != "pending":
-            return False, "Request already handled wow."
-
-        new_status = "accepted" if accept else "declined"
-        cur.execute(
-            "UPDATE friend_requests SET status = ?, responded_at = ? WHERE id = ?",
-            (new_status, _now_iso(), request_id),
-        )
-        conn.commit()
-        return True, "Fren request updated. Much decision."
+        with get_connection(db_path) as conn:
+            cur = conn.cursor()
+            cur.execute(_Q_GET_FRIEND_REQUEST, (request_id,))
+            req = cur.fetchone()
+            if not req or req["receiver_id"] != receiver_id:
+                return False, "No such fren ping."
+            if req["status"] != "pending":
+                return False, "Request already handled wow."
+
+            new_status = "accepted" if accept else "declined"
+            cur.execute(_Q_UPDATE_FRIEND_REQUEST, (new_status, request_id))
+            conn.commit()
+            return True, "Fren request updated. Much decision."
     except Exception:
-        logging.exception("respond_to_friend_request failed")
+        logger.error("respond_to_friend_request failed", exc_info=True)
         return False, "Cannot update fren req atm."
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
-def list_sent_friend_requests(user_id: int, db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def list_sent_friend_requests(user_id: int, db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            """
-            SELECT fr.*, u.username AS receiver_username, u.email AS receiver_email
-            FROM friend_requests fr
-            JOIN users u ON u.id = fr.receiver_id
-            WHERE fr.requester_id = ? AND fr.status = 'pending'
-            ORDER BY fr.created_at DESC, fr.id DESC
-            """,
-            (user_id,),
-        )
-        rows = cur.fetchall()
-        return [dict(r) for r in rows]
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_SENT_REQUESTS, (user_id,)).fetchall()
     except Exception:
-        logging.exception("list_sent_friend_requests failed")
+        logger.error("list_sent_friend_requests failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
 
 
-def list_friends(user_id: int, db_path: Optional[Path | str] = None) -> List[Dict[str, Any]]:
+def load_sidebar_bundle(user_id: Optional[int], db_path: Optional[Path | str] = None) -> Dict[str, List[sqlite3.Row]]:
+    """Fetch friends plus pending/sent friend requests over one connection.
+
+    The Streamlit sidebar needs all three on every rerun; batching them
+    here costs one pool checkout instead of three.
+    """
+    empty: Dict[str, List[sqlite3.Row]] = {"friends": [], "pending_requests": [], "sent_requests": []}
+    if not user_id:
+        return empty
     try:
-        conn = get_connection(db_path)
-        cur = conn.cursor()
-        cur.execute(
-            f"""
-            SELECT u.* FROM users u
-            WHERE u.id IN (
-                SELECT receiver_id FROM friend_requests
-                WHERE requester_id = ? AND status = 'accepted'
-                UNION
-                SELECT requester_id FROM friend_requests
-                WHERE receiver_id = ? AND status = 'accepted'
-            )
-            ORDER BY COALESCE(u.username, u.email, u.{_get_login_identifier_column(conn)})
-            """,
-            (user_id, user_id),
-        )
-        rows = cur.fetchall()
-        return [dict(r) for r in rows]
+        with get_connection(db_path) as conn:
+            friends = conn.execute(_Q_LIST_FRIENDS, (user_id, user_id, user_id)).fetchall()
+            pending = conn.execute(_Q_PENDING_REQUESTS, (user_id,)).fetchall()
+            sent = conn.execute(_Q_SENT_REQUESTS, (user_id,)).fetchall()
     except Exception:
-        logging.exception("list_friends failed")
+        logger.error("load_sidebar_bundle failed", exc_info=True)
+        return empty
+    return {"friends": friends, "pending_requests": pending, "sent_requests": sent}
+
+
+def list_friends(user_id: int, db_path: Optional[Path | str] = None) -> List[sqlite3.Row]:
+    try:
+        with get_connection(db_path) as conn:
+            return conn.execute(_Q_LIST_FRIENDS, (user_id, user_id, user_id)).fetchall()
+    except Exception:
+        logger.error("list_friends failed", exc_info=True)
         return []
-    finally:
-        try:
-            conn.close()
-        except Exception:
-            pass
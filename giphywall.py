@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import os
 import re
 from pathlib import Path
 from typing import Any, Optional
@@ -7,7 +8,7 @@ from urllib.parse import urlparse
 from uuid import uuid4
 
 import streamlit as st
-import base64
+import binascii
 import random
 
 # Support running as a package or a script: prefer relative import when possible,
@@ -22,9 +23,20 @@ st.set_page_config(page_title="Giphy Stack", layout="centered")
 
 BASE_DIR = Path(__file__).parent
 STYLES_DIR = BASE_DIR / "styles"
+STATIC_DIR = BASE_DIR / "static"
+DOGES_DIR = STATIC_DIR / "doges"
+
+_GIF_ID_RE = re.compile(r"([A-Za-z0-9]+)$")
+
+@st.cache_resource(show_spinner=False)
+def _init_db() -> bool:
+    """Create the schema once per process instead of on every rerun."""
+    giphy_db.init_db()
+    return True
+
 
 # initialize DB file alongside this module by default
-giphy_db.init_db()
+_init_db()
 
 REACTION_OPTIONS = [
     {"key": "doge", "label": "Such wow", "color": "#f5c542"},
@@ -66,8 +78,7 @@ def _ensure_protocol(url: str) -> str:
     url = url.strip()
     if not url:
         return url
-    parsed = urlparse(url)
-    if not parsed.scheme:
+    if "://" not in url[:8]:
         return f"https://{url}"
     return url
 
@@ -77,8 +88,12 @@ def extract_gif_id(raw_url: str) -> Optional[str]:
     if not raw_url:
         return None
     normalized = _ensure_protocol(raw_url)
-    parsed = urlparse(normalized)
-    path = parsed.path.rstrip("/")
+    # fast path: plain giphy links have no query/fragment to worry about,
+    # so the path falls out of two partitions without a full URL parse
+    if ("giphy.com" in normalized or "media.giphy" in normalized) and "?" not in normalized and "#" not in normalized:
+        path = normalized.partition("://")[2].partition("/")[2].rstrip("/")
+    else:
+        path = urlparse(normalized).path.rstrip("/")
     if not path:
         return None
 
@@ -87,7 +102,7 @@ def extract_gif_id(raw_url: str) -> Optional[str]:
     if "-" in slug:
         slug = slug.split("-")[-1]
 
-    match = re.search(r"([A-Za-z0-9]+)$", slug)
+    match = _GIF_ID_RE.search(slug)
     if not match:
         return None
     return match.group(1)
@@ -98,40 +113,93 @@ def build_thumbnail_url(gif_id: str) -> str:
     return f"https://media.giphy.com/media/{gif_id}/200w.gif"
 
 
-def load_local_gif_data_uri(filename: str) -> Optional[str]:
-    """Return a base64 data URI for a gif under doges/ or ../doges/."""
-    candidates = [
-        BASE_DIR / "doges" / filename,
-        BASE_DIR.parent / "doges" / filename,
-    ]
-    for path in candidates:
-        try:
-            if path.exists():
-                b = path.read_bytes()
-                return f"data:image/gif;base64,{base64.b64encode(b).decode('ascii')}"
-        except Exception:
-            continue
+def build_thumbnail_srcset(gif_id: str) -> str:
+    """srcset over Giphy's width renditions so the browser picks a size."""
+    base = f"https://media.giphy.com/media/{gif_id}"
+    return f"{base}/200w.gif 200w, {base}/480w.gif 480w"
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _encode_data_uri(path_str: str, mtime: float, mime: str) -> str:
+    """Read and base64-encode an image once per (path, mtime).
+
+    Streamlit reruns the whole script per interaction; keying the cache
+    on mtime means reruns hit an in-process dict instead of re-reading
+    and re-encoding the file, while edits still invalidate.
+    """
+    b = Path(path_str).read_bytes()
+    # b2a_base64 shaves a little off b64encode and skips the newline
+    encoded = binascii.b2a_base64(b, newline=False).decode("ascii")
+    return f"data:image/{mime};base64,{encoded}"
+
+
+def _image_source(path: Path) -> Optional[str]:
+    """Browser-cacheable source for a local image.
+
+    Files under static/ are served by Streamlit at app/static/..., so
+    the browser fetches them once and HTTP-caches them instead of
+    re-receiving a base64 blob inside every rerun's markdown. Anything
+    outside static/ falls back to an embedded data URI.
+    """
+    try:
+        if not path.exists():
+            return None
+        if path.is_relative_to(STATIC_DIR):
+            return "app/" + path.relative_to(BASE_DIR).as_posix()
+        return _encode_data_uri(str(path), path.stat().st_mtime, path.suffix.lstrip(".") or "gif")
+    except Exception:
+        return None
+
+
+def load_local_gif_source(filename: str) -> Optional[str]:
+    """Return a static URL (or data-URI fallback) for a bundled gif."""
+    for path in (DOGES_DIR / filename, BASE_DIR.parent / "doges" / filename):
+        src = _image_source(path)
+        if src:
+            return src
     return None
 
 
-def load_gifs_from_db(owner_id: Optional[int] = None) -> list[dict[str, Any]]:
-    """Load gifs from the SQLite DB and normalize to the app's card format."""
+_IMAGE_SUFFIXES = frozenset(("png", "jpg", "jpeg", "webp", "gif"))
+
+
+def _collect_doge_sources(doge_dir: Path) -> list[str]:
+    """Image sources for every image in the doge directory.
+
+    os.scandir filters on readdir data, so the suffix check costs no
+    extra stat or Path allocation per directory entry.
+    """
+    try:
+        with os.scandir(doge_dir) as it:
+            names = sorted(
+                e.name
+                for e in it
+                if e.is_file() and e.name.rpartition(".")[2].lower() in _IMAGE_SUFFIXES
+            )
+    except OSError:
+        return []
+    sources: list[str] = []
+    for name in names:
+        src = _image_source(doge_dir / name)
+        if src:
+            sources.append(src)
+    return sources
+
+
+def _rows_to_cards(rows: list[Any]) -> list[dict[str, Any]]:
+    """Normalize DB rows to the app's card format."""
     gifs: list[dict[str, Any]] = []
     try:
-        if owner_id is not None:
-            rows = giphy_db.list_giphies_for_user(owner_id)
-        else:
-            rows = []
         for r in rows:
-            gif_id = r.get("giphy_id")
-            thumbnail = r.get("thumbnail_url") or (build_thumbnail_url(gif_id) if gif_id else "")
+            gif_id = r["giphy_id"]
+            thumbnail = r["thumbnail_url"] or (build_thumbnail_url(gif_id) if gif_id else "")
             gifs.append(
                 {
-                    "uuid": r.get("uuid") or uuid4().hex,
+                    "uuid": r["uuid"] or uuid4().hex,
                     "gif_id": gif_id,
                     "embed_url": f"https://giphy.com/embed/{gif_id}" if gif_id else None,
                     "thumbnail_url": thumbnail,
-                    "source_url": r.get("giphy_url"),
+                    "source_url": r["giphy_url"],
                 }
             )
     except Exception:
@@ -140,6 +208,13 @@ def load_gifs_from_db(owner_id: Optional[int] = None) -> list[dict[str, Any]]:
     return gifs
 
 
+def load_gifs_from_db(owner_id: Optional[int] = None) -> list[dict[str, Any]]:
+    """Load gifs from the SQLite DB and normalize to the app's card format."""
+    if owner_id is None:
+        return []
+    return _rows_to_cards(giphy_db.list_wall_cards(owner_id))
+
+
 def refresh_wall_gifs(owner_id: Optional[int]) -> None:
     """Populate session state with gifs belonging to the requested wall owner."""
     st.session_state["gifs"] = load_gifs_from_db(owner_id)
@@ -162,30 +237,91 @@ def add_gif_to_state(gif_id: str, source_url: str) -> None:
             uploaded_by=uploaded_by,
         )
     except Exception:
-        pass
-    refresh_wall_gifs(st.session_state.get("active_wall_user_id"))
+        return
+    # we already know the delta, so patch the in-memory wall instead of
+    # re-selecting it; the new gif only shows when viewing own wall
+    if st.session_state.get("active_wall_user_id") == uploaded_by:
+        card = {
+            "uuid": uid,
+            "gif_id": gif_id,
+            "embed_url": f"https://giphy.com/embed/{gif_id}",
+            "thumbnail_url": thumbnail,
+            "source_url": source_url,
+        }
+        st.session_state["gifs"] = [card] + st.session_state.get("gifs", [])
 
 
 def delete_gif_from_state(uuid: str) -> None:
     try:
         giphy_db.delete_giphy_by_uuid(uuid)
     except Exception:
-        pass
-    refresh_wall_gifs(st.session_state.get("active_wall_user_id"))
+        return
+    st.session_state["gifs"] = [g for g in st.session_state.get("gifs", []) if g["uuid"] != uuid]
+
+
+@st.cache_data(show_spinner=False)
+def _read_css(path_str: str, mtime: float) -> str:
+    return Path(path_str).read_text(encoding="utf-8")
 
 
 def inject_stylesheet(filename: str) -> None:
-    """Load a CSS file from disk and inject it into the current Streamlit page."""
+    """Inject a CSS file into the current Streamlit page.
+
+    The file read is cached on (path, mtime), so reruns reuse the
+    in-memory string while stylesheet edits still invalidate. The
+    markdown is still emitted on every rerun because Streamlit drops
+    elements that are not re-emitted, so a once-per-session gate would
+    lose the styles on the first interaction.
+    """
     css_path = STYLES_DIR / filename
     try:
-        css = css_path.read_text(encoding="utf-8")
-    except (FileNotFoundError, IsADirectoryError):
-        return
+        css = _read_css(str(css_path), css_path.stat().st_mtime)
     except Exception:
         return
     st.markdown(f"<style>\n{css}\n</style>", unsafe_allow_html=True)
 
 
+def _friend_request_form(user_id: Optional[int]) -> None:
+    """Sidebar add-friend form; runs as a fragment where supported."""
+    with st.form("friend-request", clear_on_submit=True):
+        st.caption("Add fren")
+        friend_query = st.text_input(
+            "Add fren",
+            placeholder="username or email wow",
+            label_visibility="collapsed",
+        )
+        send_request = st.form_submit_button("Launch fren req", use_container_width=True)
+        if send_request:
+            query = (friend_query or "").strip()
+            if not query:
+                st.warning("Need name/email for fren req. Such empty.")
+            else:
+                target = giphy_db.find_user_by_identifier(query)
+                if not target:
+                    st.warning("No fren found. Much search again.")
+                elif target.get("id") == user_id:
+                    st.warning("That you! Mirror fren not allowed.")
+                else:
+                    ok, msg = giphy_db.create_friend_request(user_id, target.get("id"))
+                    if ok:
+                        bump_sidebar_version()
+                        st.success(msg)
+                    else:
+                        st.warning(msg)
+
+
+# scope form submits to the fragment's subtree on Streamlit 1.33+, so a
+# friend request does not rebuild the whole page; older versions just
+# run it inline
+if hasattr(st, "fragment"):
+    _friend_request_form = st.fragment(_friend_request_form)
+
+
+def bump_sidebar_version() -> None:
+    """Invalidate the cached sidebar bundle after a friend-state mutation."""
+    st.session_state["_sidebar_version"] = st.session_state.get("_sidebar_version", 0) + 1
+
+
 def clear_session_and_logout() -> None:
     st.stop()
 
@@ -235,29 +371,14 @@ def render_login_screen() -> None:
 
     with st.container():
         st.markdown('<div class="login-wrap">', unsafe_allow_html=True)
-        doge_dir = BASE_DIR / "doges"
-        doge_images: list[str] = []
-        try:
-            if doge_dir.exists() and doge_dir.is_dir():
-                for p in sorted(doge_dir.iterdir()):
-                    if p.suffix.lower() in (".png", ".jpg", ".jpeg", ".webp", ".gif"):
-                        try:
-                            b = p.read_bytes()
-                            uri = f"data:image/{p.suffix.lstrip('.')};base64,{base64.b64encode(b).decode('ascii')}"
-                            doge_images.append(uri)
-                        except Exception:
-                            continue
-        except Exception:
-            doge_images = []
+        doge_images = _collect_doge_sources(DOGES_DIR)
 
         slots = ["fd-1", "fd-2", "fd-3", "fd-4"]
-        parts: list[str] = []
         if doge_images:
-            for i, slot in enumerate(slots):
-                src = doge_images[i] if i < len(doge_images) else doge_images[i % len(doge_images)]
-                parts.append(
-                    f"<img class='float-doge {slot}' src='{src}' alt='doge' style='border-radius:50%; object-fit:cover;' />"
-                )
+            doges_html = "".join(
+                f"<img class='float-doge {slot}' src='{doge_images[i % len(doge_images)]}' alt='doge' style='border-radius:50%; object-fit:cover;' />"
+                for i, slot in enumerate(slots)
+            )
             fuzzy_positions = [
                 (8, 6),
                 (20, 10),
@@ -269,10 +390,10 @@ def render_login_screen() -> None:
             ]
         else:
             doge_url = "https://pngimg.com/d/doge_meme_PNG112723.png"
-            for slot in slots:
-                parts.append(
-                    f"<img class='float-doge {slot}' src='{doge_url}' alt='doge' style='border-radius:50%; object-fit:cover; pointer-events:none;' />"
-                )
+            doges_html = "".join(
+                f"<img class='float-doge {slot}' src='{doge_url}' alt='doge' style='border-radius:50%; object-fit:cover; pointer-events:none;' />"
+                for slot in slots
+            )
             fuzzy_positions = [
                 (6, 4),
                 (18, 12),
@@ -282,12 +403,11 @@ def render_login_screen() -> None:
                 (78, 22),
                 (34, 10),
             ]
-        for idx, (l, t) in enumerate(fuzzy_positions):
-            size_class = "small" if idx % 2 == 0 else "xs"
-            parts.append(
-                f"<div class='fuzzy {size_class}' style='left:{l}%; top:{t}%; animation: floaty-small {6+idx%4}s ease-in-out {(idx%3)/2}s infinite;'></div>"
-            )
-        st.markdown("".join(parts), unsafe_allow_html=True)
+        fuzzies_html = "".join(
+            f"<div class='fuzzy {'small' if idx % 2 == 0 else 'xs'}' style='left:{l}%; top:{t}%; animation: floaty-small {6 + idx % 4}s ease-in-out {(idx % 3) / 2}s infinite;'></div>"
+            for idx, (l, t) in enumerate(fuzzy_positions)
+        )
+        st.markdown(doges_html + fuzzies_html, unsafe_allow_html=True)
 
         st.markdown('<div class="login-box">', unsafe_allow_html=True)
         st.markdown("<div class='login-title'>MUCH GIPHY WALL</div>", unsafe_allow_html=True)
@@ -367,26 +487,35 @@ def render_login_screen() -> None:
         st.markdown("</div></div>", unsafe_allow_html=True)
 
 
-def render_snow_overlay(count: int = 24) -> None:
-    """Inject a playful falling snow overlay once per session."""
-    flakes_html: list[str] = []
-    flake_chars = ["❄", "❅", "❆"]
-    for idx in range(count):
-        left = round(random.uniform(0, 100), 2)
-        delay = round(random.uniform(0, 10), 2)
-        duration = round(random.uniform(6, 12), 2)
-        size = round(random.uniform(0.8, 1.6), 2)
-        flake = random.choice(flake_chars)
-        flakes_html.append(
-            f"<div class='giphy-snowflake' style='left:{left}%; animation-delay:{delay}s; animation-duration:{duration}s; font-size:{size}rem;'>{flake}</div>"
-        )
-    flakes_markup = "\n".join(flakes_html)
-    snow_markup = f"""
+@st.cache_data(show_spinner=False)
+def _snow_markup(count: int, seed: int) -> str:
+    """Build the randomized flake markup once per (count, seed).
+
+    The flakes only need to differ per session, not per rerun; seeding a
+    local Random keeps the layout stable while the cache skips the ~100
+    random/format calls on every interaction.
+    """
+    rng = random.Random(seed)
+    flake_chars = ("❄", "❅", "❆")
+    flakes_markup = "\n".join(
+        f"<div class='giphy-snowflake' style='left:{rng.uniform(0, 100):.2f}%;"
+        f" animation-delay:{rng.uniform(0, 10):.2f}s;"
+        f" animation-duration:{rng.uniform(6, 12):.2f}s;"
+        f" font-size:{rng.uniform(0.8, 1.6):.2f}rem;'>{rng.choice(flake_chars)}</div>"
+        for _ in range(count)
+    )
+    return f"""
     <div class='giphy-snowflakes' aria-hidden='true'>
         {flakes_markup}
     </div>
     """
-    st.markdown(snow_markup, unsafe_allow_html=True)
+
+
+def render_snow_overlay(count: int = 24) -> None:
+    """Inject a playful falling snow overlay, randomized once per session."""
+    if "_snow_seed" not in st.session_state:
+        st.session_state["_snow_seed"] = random.randint(0, 1 << 31)
+    st.markdown(_snow_markup(count, st.session_state["_snow_seed"]), unsafe_allow_html=True)
 
 
 inject_stylesheet("wall.css")
@@ -406,31 +535,45 @@ if "user" in st.session_state and st.session_state.get("user"):
         st.session_state["wall_selector"] = user_id
     if "active_wall_user_id" not in st.session_state or st.session_state.get("active_wall_user_id") is None:
         st.session_state["active_wall_user_id"] = user_id
-    friends = giphy_db.list_friends(user_id) if user_id else []
-    friend_lookup = {f.get("id"): f for f in friends if f.get("id")}
+    # one batched fetch per (user, sidebar version); mutations bump the
+    # version instead of re-querying on every rerun
+    bundle_key = (user_id, st.session_state.get("_sidebar_version", 0))
+    if st.session_state.get("_sidebar_bundle_key") != bundle_key:
+        st.session_state["_sidebar_bundle"] = giphy_db.load_sidebar_bundle(user_id)
+        st.session_state["_sidebar_bundle_key"] = bundle_key
+    bundle = st.session_state["_sidebar_bundle"]
+    friends = bundle["friends"]
+    pending_requests = bundle["pending_requests"]
+    sent_requests = bundle["sent_requests"]
+    # one pass over friends builds the lookup plus the wall-selector
+    # options and labels, instead of three separate comprehensions
+    friend_lookup: dict[int, Any] = {}
+    friend_option_ids: list[int] = [user_id] if user_id is not None else []
+    friend_labels: dict[int, str] = {user_id: "My wall"} if user_id is not None else {}
+    for f in friends:
+        fid = f["id"]
+        if fid is None:
+            continue
+        friend_lookup[fid] = f
+        friend_option_ids.append(fid)
+        name = f["username"] or f["email"] or f"Friend #{fid}"
+        friend_labels[fid] = f"{name}'s wall"
     active_wall_user_id = st.session_state.get("active_wall_user_id") or user_id
     if active_wall_user_id != user_id and active_wall_user_id not in friend_lookup:
         active_wall_user_id = user_id
         st.session_state["active_wall_user_id"] = user_id
-    pending_requests = giphy_db.list_pending_friend_requests(user_id) if user_id else []
-    sent_requests = giphy_db.list_sent_friend_requests(user_id) if user_id else []
 
     with st.sidebar:
         uname = user.get('username') or user.get('email') or 'user'
         # Single-column: kermit image, fun wording, username-as-button, then logout
         try:
-            # Prefer local in-package doges/kermit.gif
-            kermit_path = BASE_DIR / "doges" / "kermit.gif"
+            # Prefer the served static/doges/kermit.gif, then the sibling
+            # ../doge/kermit.gif (user-provided path)
             kermit_uri = None
-            if kermit_path.exists():
-                b = kermit_path.read_bytes()
-                kermit_uri = f"data:image/gif;base64,{base64.b64encode(b).decode('ascii')}"
-            else:
-                # also check a sibling ../doge/kermit.gif (user-provided path)
-                alt = BASE_DIR.parent / "doge" / "kermit.gif"
-                if alt.exists():
-                    b = alt.read_bytes()
-                    kermit_uri = f"data:image/gif;base64,{base64.b64encode(b).decode('ascii')}"
+            for cand in (DOGES_DIR / "kermit.gif", BASE_DIR.parent / "doge" / "kermit.gif"):
+                kermit_uri = _image_source(cand)
+                if kermit_uri:
+                    break
             if not kermit_uri:
                 # fallback public Kermit GIF
                 kermit_uri = "https://media.giphy.com/media/3o6ZtaO9BZHcOjmErm/giphy.gif"
@@ -479,33 +622,10 @@ if "user" in st.session_state and st.session_state.get("user"):
         st.subheader("Much Fren Zone")
         st.markdown("<div class='friend-zone-box'>", unsafe_allow_html=True)
         st.caption("Send fren req wow. Jump to buddy GIF wall, very share.")
-        with st.form("friend-request", clear_on_submit=True):
-            st.caption("Add fren")
-            friend_query = st.text_input(
-                "Add fren",
-                placeholder="username or email wow",
-                label_visibility="collapsed",
-            )
-            send_request = st.form_submit_button("Launch fren req", use_container_width=True)
-            if send_request:
-                query = (friend_query or "").strip()
-                if not query:
-                    st.warning("Need name/email for fren req. Such empty.")
-                else:
-                    target = giphy_db.find_user_by_identifier(query)
-                    if not target:
-                        st.warning("No fren found. Much search again.")
-                    elif target.get("id") == user_id:
-                        st.warning("That you! Mirror fren not allowed.")
-                    else:
-                        ok, msg = giphy_db.create_friend_request(user_id, target.get("id"))
-                        if ok:
-                            st.success(msg)
-                        else:
-                            st.warning(msg)
+        _friend_request_form(user_id)
 
         friend_gif_name = "love.gif" if pending_requests else "lonely.gif"
-        friend_gif_uri = load_local_gif_data_uri(friend_gif_name)
+        friend_gif_uri = load_local_gif_source(friend_gif_name)
         if friend_gif_uri:
             st.markdown(
                 f"""
@@ -519,13 +639,14 @@ if "user" in st.session_state and st.session_state.get("user"):
         if pending_requests:
             st.markdown("**Pending fren pings**")
             for req in pending_requests:
-                requester_label = req.get("requester_username") or req.get("requester_email") or f"User {req.get('requester_id')}"
+                requester_label = req["requester_username"] or req["requester_email"] or f"User {req['requester_id']}"
                 st.write(f"{requester_label} say \"pls fren?\"")
                 acc_col, dec_col = st.columns(2)
                 with acc_col:
                     if st.button("Much accept", key=f"accept_req_{req['id']}"):
                         ok, msg = giphy_db.respond_to_friend_request(req["id"], user_id, True)
                         if ok:
+                            bump_sidebar_version()
                             st.success("Much accepted wow.")
                         else:
                             st.warning(msg)
@@ -533,6 +654,7 @@ if "user" in st.session_state and st.session_state.get("user"):
                     if st.button("Such decline", key=f"decline_req_{req['id']}"):
                         ok, msg = giphy_db.respond_to_friend_request(req["id"], user_id, False)
                         if ok:
+                            bump_sidebar_version()
                             st.info("Declined. Much boundaries.")
                         else:
                             st.warning(msg)
@@ -542,26 +664,17 @@ if "user" in st.session_state and st.session_state.get("user"):
         if sent_requests:
             st.markdown("**Sent fren pings**")
             for req in sent_requests:
-                receiver_label = req.get("receiver_username") or req.get("receiver_email") or f"User {req.get('receiver_id')}"
+                receiver_label = req["receiver_username"] or req["receiver_email"] or f"User {req['receiver_id']}"
                 st.caption(f"Waiting on {receiver_label}")
         else:
             st.caption("No outgoing fren reqs right now.")
         st.markdown("</div>", unsafe_allow_html=True)
 
-        friend_option_ids = [uid for uid in [user_id] + [f.get("id") for f in friends if f.get("id")] if uid is not None]
         if not friend_option_ids:
             friend_option_ids = [user_id]
-        friend_labels: dict[int, str] = {}
-        if user_id is not None:
-            friend_labels[user_id] = "My wall"
-        for f in friends:
-            fid = f.get("id")
-            if fid is None:
-                continue
-            label = f.get("username") or f.get("email") or f"Friend #{fid}"
-            friend_labels[fid] = f"{label}'s wall"
+        friend_index = {uid: i for i, uid in enumerate(friend_option_ids)}
         selector_value = st.session_state.get("wall_selector", user_id)
-        if selector_value not in friend_option_ids:
+        if selector_value not in friend_index:
             selector_value = user_id
         selected_wall = st.selectbox(
             "Viewing",
@@ -569,9 +682,9 @@ if "user" in st.session_state and st.session_state.get("user"):
             format_func=lambda uid, mapping=friend_labels, me=user_id: (
                 "My wall" if me is not None and uid == me else mapping.get(uid, f"Friend #{uid}")
             ),
-            index=friend_option_ids.index(selector_value),
+            index=friend_index.get(selector_value, 0),
         )
-        if selected_wall in friend_option_ids:
+        if selected_wall in friend_index:
             st.session_state["wall_selector"] = selected_wall
             st.session_state["active_wall_user_id"] = selected_wall
             active_wall_user_id = selected_wall
@@ -584,12 +697,13 @@ if "user" in st.session_state and st.session_state.get("user"):
         refresh_wall_gifs(active_wall_user_id)
 
     viewing_self = active_wall_user_id == user_id
-    active_wall_user = user if viewing_self else friend_lookup.get(active_wall_user_id) or giphy_db.get_user_by_id(active_wall_user_id)
-    wall_owner_label = (
-        (active_wall_user or {}).get("username")
-        or (active_wall_user or {}).get("email")
-        or "Friend"
-    )
+    # list_friends selects u.*, so friend_lookup already has the wall
+    # owner's username/email; no per-navigation get_user_by_id round trip
+    active_wall_user = user if viewing_self else friend_lookup.get(active_wall_user_id)
+    # active_wall_user may be a sqlite3.Row or the session dict; both index by key
+    wall_owner_label = "Friend"
+    if active_wall_user is not None:
+        wall_owner_label = active_wall_user["username"] or active_wall_user["email"] or "Friend"
 
     if viewing_self:
         st.title("Such My Giphy Wall")
@@ -634,27 +748,55 @@ if submitted:
     else:
         st.error("Hmm, link not giphy enough. Much retry.")
 
+def _show_more_gifs() -> None:
+    st.session_state["_wall_visible"] = st.session_state.get("_wall_visible", 30) + 30
+
+
 wall_gifs = st.session_state.get("gifs") or []
 if wall_gifs:
-    for gif in wall_gifs:
+    # bound the widget tree: long walls register a container (and delete
+    # button) per gif on every rerun, so only mount the first N cards
+    visible = st.session_state.setdefault("_wall_visible", 30)
+    for gif in wall_gifs[:visible]:
         with st.container():
+            srcset = f"srcset=\"{build_thumbnail_srcset(gif['gif_id'])}\" sizes=\"(max-width: 600px) 200px, 480px\"" if gif["gif_id"] else ""
             st.markdown(
                 f"""
                 <div class="giphy-card">
                     <img
                         src="{gif['thumbnail_url']}"
+                        {srcset}
                         alt="Giphy {gif['gif_id']}"
                         loading="lazy"
+                        decoding="async"
                     />
                 </div>
                 """,
                 unsafe_allow_html=True,
             )
-            if viewing_self:
-                delete = st.button("Yikes, delete", key=f"delete_{gif['uuid']}")
-                if delete:
-                    delete_gif_from_state(gif["uuid"])
-                    st.rerun()
+    if viewing_self:
+        # one form instead of a delete button per card keeps the widget
+        # count constant no matter how long the wall grows
+        visible_gifs = wall_gifs[:visible]
+        labels = {
+            g["uuid"]: f"#{i + 1} · {g['gif_id'] or g['uuid'][:8]}"
+            for i, g in enumerate(visible_gifs)
+        }
+        with st.form("delete-giphy"):
+            target_uuid = st.selectbox(
+                "Which gif go bye?",
+                [g["uuid"] for g in visible_gifs],
+                format_func=labels.__getitem__,
+            )
+            if st.form_submit_button("Yikes, delete"):
+                delete_gif_from_state(target_uuid)
+                st.rerun()
+    if len(wall_gifs) > visible:
+        st.button(
+            f"Load more wow ({len(wall_gifs) - visible} hiding)",
+            key="load_more_gifs",
+            on_click=_show_more_gifs,
+        )
 else:
     if viewing_self:
         st.info("No gifs yet. Drop first link above, amaze incoming!")
@@ -0,0 +1,28 @@
+"""One-shot optimizer for the bundled doge GIFs.
+
+The login page serves everything under static/doges/, so
+every byte saved here shrinks the first fetch of each asset. Run this
+once after adding or replacing assets, then commit the smaller files:
+
+    pip install pygifsicle  # needs the gifsicle binary on PATH
+    python scripts/optimize_doges.py
+"""
+from __future__ import annotations
+
+from pathlib import Path
+
+from pygifsicle import optimize
+
+DOGES_DIR = Path(__file__).resolve().parent.parent / "static" / "doges"
+
+
+def main() -> None:
+    for path in sorted(DOGES_DIR.glob("*.gif")):
+        before = path.stat().st_size
+        optimize(str(path))
+        after = path.stat().st_size
+        print(f"{path.name}: {before} -> {after} bytes")
+
+
+if __name__ == "__main__":
+    main()